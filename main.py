@@ -1,9 +1,29 @@
-from enum import Enum
+from collections import OrderedDict
+from functools import lru_cache
 from itertools import product
-from typing import Any, Iterable, Callable
-import os
+from operator import itemgetter
+from typing import Any, Callable, TextIO
+import atexit
+import random
+import sys
 
-from color_print import ColorPrint, Color
+from color_print import BLUE, GREEN, RED, RESET
+
+
+_log_file: TextIO | None = None
+
+
+def _get_log_file() -> TextIO:
+    """Open the game log on first use and keep it open until the program exits.
+
+    Returns:
+        TextIO: The buffered game log file.
+    """
+    global _log_file
+    if _log_file is None:
+        _log_file = open("game_log.txt", "a", buffering=8192)
+        atexit.register(_log_file.close)
+    return _log_file
 
 
 def game_log(func: Callable[..., str]) -> Callable[..., str]:
@@ -18,27 +38,243 @@ def game_log(func: Callable[..., str]) -> Callable[..., str]:
 
     def wrapper(*args: Any, **kwargs: Any) -> str:
         result: str = func(*args, **kwargs)
-        with open("game_log.txt", "a") as log_file:
-            log_file.write(f"{result}\n")
+        log_file: TextIO = _get_log_file()
+        log_file.write(result)
+        log_file.write("\n")
         return result
 
     return wrapper
 
 
-class MOVE(Enum):
-    RIGHT = "right"
-    LEFT = "left"
-    UP = "up"
-    DOWN = "down"
+_RNG_CHOICE: Callable[[list[Any]], Any] = random.Random().choice
+
+RIGHT: int = 0
+LEFT: int = 1
+UP: int = 2
+DOWN: int = 3
+
+# Offsets (row, col, jumped row, jumped col) of each move, indexed by direction
+DIRECTIONS: tuple[tuple[int, int, int, int], ...] = (
+    (0, 2, 0, 1),
+    (0, -2, 0, -1),
+    (-2, 0, -1, 0),
+    (2, 0, 1, 0),
+)
+MOVE_NAMES: tuple[str, ...] = ("right", "left", "up", "down")
+ALPHABET: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Values of the cells of the rendered board
+EMPTY_HOLE: int = 0
+PEG: int = 1
+CORNER: int = 2
+
+# Board cells rendered once so show_board only joins strings, indexed by value
+CELL_STRINGS: tuple[str, ...] = (
+    f"{GREEN}0{RESET}|",
+    f"{RED}1{RESET}|",
+    f"{GREEN} {RESET}|",
+)
+# Clear the screen and move the cursor home, flushed with the next board
+CLEAR: str = "\033[2J\033[H"
+
+# Pagoda weights per board size, one per cell bit with 0 on the corners. For
+# every move the weights of the peg and the peg jumped over add up to at least
+# the weight of the landing hole, so no move can raise a pagoda bound
+PAGODA_WEIGHTS: dict[int, tuple[int, ...]] = {
+    7: (
+        0, 0, -1, 0, -1, 0, 0,
+        0, 0, 1, 1, 1, 0, 0,
+        -1, 1, 0, 1, 0, 1, -1,
+        0, 1, 1, 2, 1, 1, 0,
+        -1, 1, 0, 1, 0, 1, -1,
+        0, 0, 1, 1, 1, 0, 0,
+        0, 0, -1, 0, -1, 0, 0,
+    ),
+}
 
+# A move is (from_bit, jumped_bit, to_bit, row, col, direction, label), the
+# label being how show_moves displays it
+Move = tuple[int, int, int, int, int, int, str]
+
+
+@lru_cache
+def _corner_mask(size: int, corner_size: tuple[int, int]) -> int:
+    """Build the bitboard of the cells in the four corners of the board.
+
+    Args:
+        size (int): The size of the board.
+        corner_size (tuple[int, int]): The size of the corners.
+
+    Returns:
+        int: The bitboard with every corner cell set.
+    """
+    mask: int = 0
+    for row, col in product(range(size), range(size)):
+        rows_in_corner: bool = row < corner_size[0] or row >= size - corner_size[0]
+        cols_in_corner: bool = col < corner_size[1] or col >= size - corner_size[1]
+        if rows_in_corner and cols_in_corner:
+            mask |= 1 << (row * size + col)
+    return mask
+
+
+@lru_cache(maxsize=8)
+def _initial_bitboards(size: int, corner_size: tuple[int, int]) -> tuple[int, int]:
+    """Set up the initial game board.
+
+    Bit ``row * size + col`` of each bitboard stands for the cell at
+    ``(row, col)``. Corner cells are set in neither of them.
+
+    Args:
+        size (int): The size of the board.
+        corner_size (tuple[int, int]): The size of the corners.
+
+    Returns:
+        tuple[int, int]: The initial pegs and empty holes bitboards.
+    """
+    all_cells: int = (1 << (size * size)) - 1
+    pegs: int = all_cells & ~_corner_mask(size, corner_size)
+
+    center: int = size // 2
+    center_bit: int = 1 << (center * size + center)
+
+    return pegs & ~center_bit, center_bit
 
-DIRECTIONS: dict[MOVE, tuple[int, int, int, int]] = {
-    MOVE.RIGHT: (0, 2, 0, 1),
-    MOVE.LEFT: (0, -2, 0, -1),
-    MOVE.UP: (-2, 0, -1, 0),
-    MOVE.DOWN: (2, 0, 1, 0),
-}
-ALPHABET: str = "ABCDEFG"
+
+@lru_cache
+def _build_move_table(size: int, corner_size: tuple[int, int]) -> tuple[Move, ...]:
+    """Build every move whose three cells lie on the board, whatever the pegs.
+
+    Args:
+        size (int): The size of the board.
+        corner_size (tuple[int, int]): The size of the corners.
+
+    Returns:
+        tuple[Move, ...]: The candidate moves, ordered by row, column and direction.
+    """
+    corner_mask: int = _corner_mask(size, corner_size)
+    table: list[Move] = []
+    for row, col, direction in product(
+        range(size), range(size), range(len(DIRECTIONS))
+    ):
+        row_offset, col_offset, jump_row_offset, jump_col_offset = DIRECTIONS[
+            direction
+        ]
+        cells: tuple[tuple[int, int], ...] = (
+            (row, col),
+            (row + jump_row_offset, col + jump_col_offset),
+            (row + row_offset, col + col_offset),
+        )
+        if all(
+            0 <= r < size and 0 <= c < size and not (corner_mask >> (r * size + c)) & 1
+            for r, c in cells
+        ):
+            from_bit, jumped_bit, to_bit = (r * size + c for r, c in cells)
+            label: str = f"('{ALPHABET[row]}', {col + 1}, '{MOVE_NAMES[direction]}')"
+            table.append((from_bit, jumped_bit, to_bit, row, col, direction, label))
+    return tuple(table)
+
+
+@lru_cache
+def _build_move_set(size: int, corner_size: tuple[int, int]) -> frozenset[Move]:
+    """Build the set of candidate moves for constant time membership tests.
+
+    Args:
+        size (int): The size of the board.
+        corner_size (tuple[int, int]): The size of the corners.
+
+    Returns:
+        frozenset[Move]: The moves of the move table.
+    """
+    return frozenset(_build_move_table(size, corner_size))
+
+
+@lru_cache
+def _build_jump_masks(
+    size: int, corner_size: tuple[int, int]
+) -> tuple[tuple[int, int, dict[int, Move]], ...]:
+    """Group the move table by direction for bit-parallel move generation.
+
+    Args:
+        size (int): The size of the board.
+        corner_size (tuple[int, int]): The size of the corners.
+
+    Returns:
+        tuple[tuple[int, int, dict[int, Move]], ...]: For each direction, the bit
+            distance from a peg to the peg it jumps over, the bitboard of the
+            cells a move can start from and the moves keyed by their starting bit.
+    """
+    jump_masks: list[tuple[int, int, dict[int, Move]]] = []
+    for direction in range(len(DIRECTIONS)):
+        moves: list[Move] = [
+            move
+            for move in _build_move_table(size, corner_size)
+            if move[5] == direction
+        ]
+        if not moves:
+            continue
+        step: int = moves[0][1] - moves[0][0]
+        origins: int = 0
+        moves_by_origin: dict[int, Move] = {}
+        for move in moves:
+            origins |= 1 << move[0]
+            moves_by_origin[1 << move[0]] = move
+        jump_masks.append((step, origins, moves_by_origin))
+    return tuple(jump_masks)
+
+
+@lru_cache
+def _build_symmetries(size: int) -> tuple[tuple[int, ...], ...]:
+    """Build the 8 rotations and reflections of the square board as bit maps.
+
+    Args:
+        size (int): The size of the board.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: For each symmetry, the single bit each
+            cell bit is sent to, indexed by the cell bit.
+    """
+    last: int = size - 1
+    transforms: tuple[Callable[[int, int], tuple[int, int]], ...] = (
+        lambda row, col: (row, col),
+        lambda row, col: (col, last - row),
+        lambda row, col: (last - row, last - col),
+        lambda row, col: (last - col, row),
+        lambda row, col: (row, last - col),
+        lambda row, col: (last - row, col),
+        lambda row, col: (col, row),
+        lambda row, col: (last - col, last - row),
+    )
+    symmetries: list[tuple[int, ...]] = []
+    for transform in transforms:
+        targets: list[int] = []
+        for row, col in product(range(size), range(size)):
+            moved_row, moved_col = transform(row, col)
+            targets.append(1 << (moved_row * size + moved_col))
+        symmetries.append(tuple(targets))
+    return tuple(symmetries)
+
+
+def _canonicalize(pegs: int, size: int) -> int:
+    """Get the smallest bitboard among the symmetric images of a position.
+
+    Args:
+        pegs (int): The pegs bitboard.
+        size (int): The size of the board.
+
+    Returns:
+        int: The same value for every position equivalent under symmetry.
+    """
+    canonical: int = pegs
+    for targets in _build_symmetries(size)[1:]:
+        image: int = 0
+        remaining: int = pegs
+        while remaining:
+            peg: int = remaining & -remaining
+            image |= targets[peg.bit_length() - 1]
+            remaining ^= peg
+        if image < canonical:
+            canonical = image
+    return canonical
 
 
 class Solitaire:
@@ -46,175 +282,180 @@ class Solitaire:
     Attributes:
         size (int): The size of the board.
         corner_size (tuple[int, int]): The size of the corners.
-        board (list[list[str]]): The game board.
-        counter (Callable[[], int]): A function to count the number of moves made.
+        pegs (int): Bitboard of the holes holding a peg.
+        empty_mask (int): Bitboard of the empty holes.
+        board (bytearray): The game board, rendered from the bitboards.
 
     Args:
         size (int): The size of the board. Default is 7.
         corner_size (tuple[int, int]): The size of the corners. Default is (2, 2).
+        seed (int | None): Seed for the random mode moves. Default is None.
+
+    Raises:
+        ValueError: If the board has more rows than ALPHABET has labels.
     """
 
-    def __init__(self, size: int = 7) -> None:
+    # Positions known to be lost, keyed by (size, canonical pegs) so the
+    # symmetric images of a position share one entry. Shared by every game
+    # and evicted least recently used first once the table is full
+    _TT: OrderedDict[tuple[int, int], bool] = OrderedDict()
+    _TT_MAX_ENTRIES: int = 1_000_000
+
+    __slots__ = (
+        "_size",
+        "_corner_size",
+        "pegs",
+        "empty_mask",
+        "_move_set",
+        "_jump_masks",
+        "_cached_moves",
+        "_choice",
+        "_move_count",
+    )
+
+    def __init__(self, size: int = 7, seed: int | None = None) -> None:
+        if size > len(ALPHABET):
+            raise ValueError(f"The board size must be at most {len(ALPHABET)}")
+
         self._size: int = size
         self._corner_size: tuple[int, int] = (2, 2)
-        self.board: list[list[str]] = self._setup_board()
-        self.counter: Callable[[], int] = self._create_counter()
+        self.pegs: int
+        self.empty_mask: int
+        self.pegs, self.empty_mask = _initial_bitboards(self._size, self._corner_size)
+        self._move_set: frozenset[Move] = _build_move_set(
+            self._size, self._corner_size
+        )
+        self._jump_masks: tuple[tuple[int, int, dict[int, Move]], ...] = (
+            _build_jump_masks(self._size, self._corner_size)
+        )
+        self._cached_moves: list[Move] | None = None
+        self._choice: Callable[[list[Move]], Move] = (
+            _RNG_CHOICE if seed is None else random.Random(seed).choice
+        )
+        self._move_count: int = 0
+
+    @property
+    def board(self) -> bytearray:
+        """Render the bitboards as a flat grid of cells.
 
-    def _setup_board(self) -> list[list[str]]:
-        """Set up the initial game board.
+        Cell ``(row, col)`` is at index ``row * size + col`` and holds PEG,
+        EMPTY_HOLE or CORNER.
 
         Returns:
-            list[list[str]]: The initial game board.
+            bytearray: The game board.
         """
+        board: bytearray = bytearray(self._size * self._size)
+        corners: int = _corner_mask(self._size, self._corner_size)
+        for value, cells in ((PEG, self.pegs), (CORNER, corners)):
+            while cells:
+                cell: int = cells & -cells
+                board[cell.bit_length() - 1] = value
+                cells ^= cell
+        return board
 
-        def is_corner(row: int, col: int) -> bool:
-            """Check if the given cell is in one of the four corners of the board.
-
-            Args:
-                row (int): The row index of the cell.
-                col (int): The column index of the cell.
-
-            Returns:
-                bool: True if the cell is in a corner, False otherwise.
-            """
-            rows_in_corner: bool = (
-                row < self._corner_size[0] or row >= self._size - self._corner_size[0]
-            )
-            cols_in_corner: bool = (
-                col < self._corner_size[1] or col >= self._size - self._corner_size[1]
-            )
-            return rows_in_corner and cols_in_corner
-
-        self.board = [
-            [" " if is_corner(row=row, col=col) else "1" for col in range(self._size)]
-            for row in range(self._size)
-        ]
-
-        center: int = self._size // 2
+    def show_board(self) -> None:
+        """Display the board, written to the terminal in a single call."""
+        size: int = self._size
+        board: bytearray = self.board
 
-        self.board[center][center] = "0"
+        parts: list[str] = ["  "]
+        append: Callable[[str], None] = parts.append
+        for i in range(size):
+            append(f"{BLUE}{i + 1}{RESET} ")
+        append("\n")
+        for row in range(size):
+            append(f"{BLUE}{ALPHABET[row]}{RESET}|")
+            for cell in board[row * size : (row + 1) * size]:
+                append(CELL_STRINGS[cell])
+            append("\n")
 
-        return self.board
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
 
-    def show_board(self) -> None:
+    def get_valid_moves(self) -> list[Move]:
+        """Get the moves that can be played on the current board.
 
-        print("  ", end="")
-        for i in range(self._size):
-            ColorPrint.print_colored(str(i + 1), Color.BLUE, end=" ")
-        print()
-        for row, cells in enumerate(self.board):
-            # print(alphabet[row], end="|")
-            # for cell in cells:
-            #     print(cell, end="|")
-            # print()
-            ColorPrint.print_colored(ALPHABET[row], Color.BLUE, end="|")
-            for cell in cells:
-                color = Color.RED if cell == "1" else Color.GREEN
-                ColorPrint.print_colored(cell, color, end="|")
-            print()
-
-    def get_valid_moves(self) -> list[tuple[int, int, MOVE]]:
-        def is_valid_move(row: int, col: int, direction: MOVE) -> bool:
-            """Check if a move is valid.
-
-            Args:
-                row (int): The row index of the peg.
-                col (int): The column index of the peg.
-                direction (MOVE): The direction of the move.
-
-            Returns:
-                bool: True if the move is valid, False otherwise.
-            """
-
-            if direction not in DIRECTIONS:
-                return False
-
-            row_offset, col_offset, remove_row_offset, remove_col_offset = DIRECTIONS[
-                direction
-            ]
-
-            row_moved: int = row + row_offset
-            col_moved: int = col + col_offset
-            removed_row: int = row + remove_row_offset
-            removed_col: int = col + remove_col_offset
-
-            return (
-                0 <= row_moved < self._size
-                and 0 <= col_moved < self._size
-                and self.board[row][col] == "1"
-                and self.board[row_moved][col_moved] == "0"
-                and self.board[removed_row][removed_col] == "1"
-            )
-
-        all_options: Iterable[tuple[int, int, MOVE]] = product(
-            range(self._size), range(self._size), DIRECTIONS.keys()
-        )
+        The list is cached and shared until the next move is applied.
 
-        return list(
-            filter(
-                lambda option: is_valid_move(option[0], option[1], option[2]),
-                all_options,
-            )
-        )
-
-    def show_moves(self, moves: list[tuple[int, int, MOVE]]) -> None:
+        Returns:
+            list[Move]: The valid moves.
+        """
+        if self._cached_moves is not None:
+            return self._cached_moves
+
+        pegs: int = self.pegs
+        empty: int = self.empty_mask
+        moves: list[Move] = []
+        append: Callable[[Move], None] = moves.append
+        for step, origins, moves_by_origin in self._jump_masks:
+            # Align the jumped and landing cells with the starting cell so one
+            # AND tests the direction for every starting cell at once
+            if step > 0:
+                starts: int = origins & pegs & (pegs >> step) & (empty >> 2 * step)
+            else:
+                starts = origins & pegs & (pegs << -step) & (empty << -2 * step)
+            while starts:
+                start: int = starts & -starts
+                append(moves_by_origin[start])
+                starts ^= start
+        moves.sort(key=itemgetter(0, 5))
+
+        self._cached_moves = moves
+        return self._cached_moves
+
+    def show_moves(self, moves: list[Move]) -> None:
         """Display the valid moves on the board.
 
         Args:
-            moves (list[tuple[int, int, MOVE]]): The list of valid moves.
+            moves (list[Move]): The list of valid moves.
         """
-        mapped_moves: list[tuple[str, int, str]] = list(
-            map(lambda move: (ALPHABET[move[0]], move[1] + 1, move[2].value), moves)
+        sys.stdout.write(
+            "".join(f"{i + 1} {move[6]}\n" for i, move in enumerate(moves))
         )
 
-        for i, move in enumerate(mapped_moves):
-            print(f"{i + 1} {move}")
-
-    def apply_move(self, move: tuple[int, int, MOVE]) -> None:
+    def apply_move(self, move: Move) -> None:
         """Apply a move to the board.
 
         Args:
-            move (tuple[int, int, MOVE]): The move to apply.
+            move (Move): The move to apply.
+
+        Raises:
+            ValueError: If the move is not a jump of this board or cannot be
+                played on the current position.
         """
-        if move not in self.get_valid_moves():
+        if move not in self._move_set:
+            raise ValueError("Invalid move")
+
+        from_bit: int = move[0]
+        jumped_bit: int = move[1]
+        to_bit: int = move[2]
+
+        pegs: int = self.pegs
+        empty: int = self.empty_mask
+        if not (pegs >> from_bit) & (pegs >> jumped_bit) & (empty >> to_bit) & 1:
             raise ValueError("Invalid move")
 
-        row: int
-        col: int
-        direction: MOVE
-        row, col, direction = move
-
-        row_offset: int
-        col_offset: int
-        row_jump_offset: int
-        col_jump_offset: int
-        row_offset, col_offset, row_jump_offset, col_jump_offset = DIRECTIONS[direction]
-
-        # Remove the peg at the starting position
-        self.board[row][col] = "0"
-        # Remove the peg at the position jumped over
-        self.board[row + row_jump_offset][col + col_jump_offset] = "0"
-        # Place the peg at the new position
-        self.board[row + row_offset][col + col_offset] = "1"
-
-    def get_selection(
-        self, moves: list[tuple[int, int, MOVE]], use_random_mode: bool
-    ) -> tuple[int, int, MOVE]:
+        # The starting and jumped over holes lose their pegs and the landing
+        # hole gains one, so flipping the three bits updates both bitboards
+        jump: int = (1 << from_bit) | (1 << jumped_bit) | (1 << to_bit)
+        self.pegs ^= jump
+        self.empty_mask ^= jump
+        self._cached_moves = None
+        self._move_count += 1
+
+    def get_selection(self, moves: list[Move], use_random_mode: bool) -> Move:
         """Get a move selection from the user.
 
         Args:
-            moves (list[tuple[int, int, MOVE]]): The list of valid moves.
+            moves (list[Move]): The list of valid moves.
             use_random_mode (bool): Whether to use random mode for selection.
 
         Returns:
-            tuple[int, int, MOVE]: The selected move.
+            Move: The selected move.
         """
         number_of_moves: int = len(moves)
         if use_random_mode:
-            import random
-
-            selected_move: tuple[int, int, MOVE] = random.choice(moves)
-            return selected_move
+            return self._choice(moves)
 
         while True:
             selection: str = input(
@@ -224,13 +465,26 @@ class Solitaire:
                 return moves[int(selection) - 1]
             print("Invalid selection. Please try again.")
 
+    def self_play(self) -> tuple[bool, int]:
+        """Play random moves until none are left, without any terminal output.
+
+        Returns:
+            tuple[bool, int]: Whether the game was won and the number of pegs left.
+        """
+        choice: Callable[[list[Move]], Move] = self._choice
+        while True:
+            moves: list[Move] = self.get_valid_moves()
+            if not moves:
+                return self.validate_win(), self.count_pegs()
+            self.apply_move(choice(moves))
+
     def count_pegs(self) -> int:
         """Count the number of pegs on the board.
 
         Returns:
             int: The number of pegs on the board.
         """
-        return sum(row.count("1") for row in self.board)
+        return self.pegs.bit_count()
 
     def validate_win(self) -> bool:
         """Check if the game is won.
@@ -238,30 +492,75 @@ class Solitaire:
         Returns:
             bool: True if the game is won, False otherwise.
         """
-        return (
-            self.count_pegs() == 1
-            and self.board[self._size // 2][self._size // 2] == "1"
+        center: int = self._size // 2
+        return self.pegs == 1 << (center * self._size + center)
+
+    def pagoda_bound(self) -> int:
+        """Sum the pagoda weights of the cells holding a peg.
+
+        A solver can prune any position whose bound is lower than the bound
+        of its goal, since moves never raise it: the winning position with a
+        single peg in the center has a bound of 2 on the 7x7 board.
+
+        Raises:
+            ValueError: If there are no pagoda weights for the board size.
+
+        Returns:
+            int: The pagoda bound of the current position.
+        """
+        if self._size not in PAGODA_WEIGHTS:
+            raise ValueError(f"No pagoda weights for a board of size {self._size}")
+
+        pegs: int = self.pegs
+        return sum(
+            weight
+            for bit, weight in enumerate(PAGODA_WEIGHTS[self._size])
+            if (pegs >> bit) & 1
         )
 
-    def _create_counter(self) -> Callable[[], int]:
-        """Create a counter for the number of moves made.
+    def is_dead_end(self) -> bool:
+        """Check if the current position is known to be unsolvable.
+
+        A position without valid moves that is not a win is recorded as a
+        dead end, so a solver can call this before recursing.
 
         Returns:
-            Callable[None, int]: A function that returns the number of moves made.
+            bool: True if the game can no longer be won from here, False otherwise.
+        """
+        key: tuple[int, int] = self._tt_key()
+        if key in self._TT:
+            self._TT.move_to_end(key)
+            return True
+
+        if self.get_valid_moves() or self.validate_win():
+            return False
+
+        self.mark_dead_end()
+        return True
+
+    def mark_dead_end(self) -> None:
+        """Record the current position as unsolvable.
+
+        A solver calls this once every move from the position has failed.
         """
-        count: int = 0
+        key: tuple[int, int] = self._tt_key()
+        self._TT[key] = True
+        self._TT.move_to_end(key)
+        if len(self._TT) > self._TT_MAX_ENTRIES:
+            self._TT.popitem(last=False)
 
-        def increase() -> int:
-            nonlocal count
-            count += 1
-            return count
+    def _tt_key(self) -> tuple[int, int]:
+        """Get the transposition table key of the current position.
 
-        return increase
+        Returns:
+            tuple[int, int]: The board size and the canonical pegs bitboard.
+        """
+        return self._size, _canonicalize(self.pegs, self._size)
 
     @game_log
     def end_game(self) -> str:
         """End the game and display the result."""
-        moves_made: int = self.counter() - 1
+        moves_made: int = self._move_count
         remaining_pegs: int = self.count_pegs()
         return f"{'VICTORY' if self.validate_win() else 'DEFEAT'} | Moves made: {moves_made} | Remaining pegs: {remaining_pegs}"
 
@@ -287,46 +586,44 @@ def ask_custom_size() -> int:
         size: str = input("Enter the board size (default is 7): ").strip()
         if not size:
             return 7
-        if size.isdigit() and int(size) % 2 == 1:
+        if size.isdigit() and int(size) % 2 == 1 and int(size) <= len(ALPHABET):
             return int(size)
-        print("Invalid size. Please enter an odd number.")
+        print(f"Invalid size. Please enter an odd number up to {len(ALPHABET)}.")
 
 
 def main() -> None:
-    os.system("cls" if os.name == "nt" else "clear")
+    sys.stdout.write(CLEAR)
 
     print("Welcome to Peg Solitaire!")
 
     size: int = ask_custom_size()
 
     use_random_mode: bool = ask_random_mode()
-    os.system("cls" if os.name == "nt" else "clear")
+    sys.stdout.write(CLEAR)
 
     game: Solitaire = Solitaire(size=size)
 
     is_playing: bool = True
     while is_playing:
         game.show_board()
-        moves: list[tuple[int, int, MOVE]] = game.get_valid_moves()
+        moves: list[Move] = game.get_valid_moves()
         if not moves:
             print("No valid moves available. Game over!")
             is_playing = False
             continue
 
         game.show_moves(moves)
-        selected_move: tuple[int, int, MOVE] = game.get_selection(
-            moves, use_random_mode
-        )
+        selected_move: Move = game.get_selection(moves, use_random_mode)
 
         try:
             game.apply_move(selected_move)
-            game.counter()
-            os.system("cls" if os.name == "nt" else "clear")
+            sys.stdout.write(CLEAR)
         except ValueError as e:
-            os.system("cls" if os.name == "nt" else "clear")
+            sys.stdout.write(CLEAR)
             print(f"Error applying move: {e}")
 
     print(game.end_game())
 
 
-main()
+if __name__ == "__main__":
+    main()